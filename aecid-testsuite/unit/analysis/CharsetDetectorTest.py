@@ -122,6 +122,111 @@ class CharsetDetectorTest(TestBase):
                                                                       'MissingCharacters': ['m']}})
         test_handler.anomaly = None
 
+    def test2_ignore_and_constraint_paths(self):
+        """This test case checks that atoms are skipped when ignore paths are present or constraint paths are missing."""
+        description = "Test2CharsetDetector"
+        test_handler = TestHandler()
+        event_charset_detector = CharsetDetector(self.aminer_config, [test_handler], [], ['/model/value'], 'Default', True, False,
+                                                 constraint_list=['/model/value'])
+        self.analysis_context.register_component(event_charset_detector, description)
+
+        m_1 = MatchElement('/model/id', b'a', b'a', None)
+        m_2 = MatchElement('/model/value', b'abc', b'abc', None)
+        log_atom_1 = LogAtom(b'aabc', ParserMatch(MatchElement('/model', b'aabc', b'aabc', [m_1, m_2])), 1, None)
+        m_3 = MatchElement('/model/value', b'xyz', b'xyz', None)
+        log_atom_2 = LogAtom(b'xyz', ParserMatch(MatchElement('/model', b'xyz', b'xyz', [m_3])), 2, None)
+        m_4 = MatchElement('/model/other', b'xyz', b'xyz', None)
+        log_atom_3 = LogAtom(b'xyz', ParserMatch(MatchElement('/model', b'xyz', b'xyz', [m_4])), 3, None)
+
+        # The constraint path is missing, so the atom is not analyzed.
+        event_charset_detector.receive_atom(log_atom_3)
+        self.assertEqual(event_charset_detector.log_success, 0)
+        event_charset_detector.receive_atom(log_atom_1)
+        self.assertEqual(event_charset_detector.log_success, 1)
+
+        # After blocklisting the id path, atoms containing it are ignored.
+        event_charset_detector.blocklist_event('Analysis.CharsetDetector', '/model/id', None)
+        event_charset_detector.receive_atom(log_atom_1)
+        self.assertEqual(event_charset_detector.log_success, 1)
+        event_charset_detector.receive_atom(log_atom_2)
+        self.assertEqual(event_charset_detector.log_success, 2)
+        self.assertEqual(test_handler.anomaly, {'AnalysisComponent': {'AffectedLogAtomPaths': ['/model/value'],
+                                                                      'AffectedLogAtomValues': ['xyz'],
+                                                                      'MissingCharacters': ['x', 'y', 'z']}})
+
+    def test3_multibyte_characters(self):
+        """This test case checks that bytes of multibyte characters, which can not be decoded on their own, are reported escaped."""
+        description = "Test3CharsetDetector"
+        test_handler = TestHandler()
+        event_charset_detector = CharsetDetector(self.aminer_config, [test_handler], [], ['/model/value'], 'Default', True, False)
+        self.analysis_context.register_component(event_charset_detector, description)
+
+        m_1 = MatchElement('/model/value', b'abc', b'abc', None)
+        log_atom_1 = LogAtom(b'abc', ParserMatch(MatchElement('/model', b'abc', b'abc', [m_1])), 1, None)
+        value = 'aä'.encode()
+        m_2 = MatchElement('/model/value', value, value, None)
+        log_atom_2 = LogAtom(value, ParserMatch(MatchElement('/model', value, value, [m_2])), 2, None)
+
+        event_charset_detector.receive_atom(log_atom_1)
+        self.assertIsNone(test_handler.anomaly)
+        event_charset_detector.receive_atom(log_atom_2)
+        self.assertEqual(test_handler.anomaly, {'AnalysisComponent': {'AffectedLogAtomPaths': ['/model/value'],
+                                                                      'AffectedLogAtomValues': ['aä'],
+                                                                      'MissingCharacters': ['\\xc3', '\\xa4']}})
+
+    def test4_persistence(self):
+        """This test case checks that persisted charsets are used for the detection after loading them."""
+        description = "Test4CharsetDetector"
+        test_handler = TestHandler()
+        event_charset_detector = CharsetDetector(self.aminer_config, [test_handler], [], ['/model/value'], 'Default', True, False)
+        self.analysis_context.register_component(event_charset_detector, description)
+
+        m_1 = MatchElement('/model/value', b'abc', b'abc', None)
+        log_atom_1 = LogAtom(b'abc', ParserMatch(MatchElement('/model', b'abc', b'abc', [m_1])), 1, None)
+        m_2 = MatchElement('/model/value', b'cab', b'cab', None)
+        log_atom_2 = LogAtom(b'cab', ParserMatch(MatchElement('/model', b'cab', b'cab', [m_2])), 2, None)
+        m_3 = MatchElement('/model/value', b'abd', b'abd', None)
+        log_atom_3 = LogAtom(b'abd', ParserMatch(MatchElement('/model', b'abd', b'abd', [m_3])), 3, None)
+
+        event_charset_detector.receive_atom(log_atom_1)
+        event_charset_detector.do_persist()
+
+        event_charset_detector = CharsetDetector(self.aminer_config, [test_handler], [], ['/model/value'], 'Default', False, False)
+        event_charset_detector.receive_atom(log_atom_2)
+        self.assertIsNone(test_handler.anomaly)
+        event_charset_detector.receive_atom(log_atom_3)
+        self.assertEqual(test_handler.anomaly, {'AnalysisComponent': {'AffectedLogAtomPaths': ['/model/value'],
+                                                                      'AffectedLogAtomValues': ['abd'],
+                                                                      'MissingCharacters': ['d']}})
+
+    def test5_change_target_path_list(self):
+        """This test case checks that changed path lists are used for the detection, e.g., after changing them with the remote control."""
+        description = "Test5CharsetDetector"
+        test_handler = TestHandler()
+        event_charset_detector = CharsetDetector(self.aminer_config, [test_handler], [], ['/model/value'], 'Default', True, False)
+        self.analysis_context.register_component(event_charset_detector, description)
+
+        m_1 = MatchElement('/model/value', b'abc', b'abc', None)
+        m_2 = MatchElement('/model/other', b'xyz', b'xyz', None)
+        log_atom_1 = LogAtom(b'abcxyz', ParserMatch(MatchElement('/model', b'abcxyz', b'abcxyz', [m_1, m_2])), 1, None)
+        event_charset_detector.receive_atom(log_atom_1)
+        self.assertIsNone(test_handler.anomaly)
+
+        # The new target path is analyzed instead of the old one.
+        event_charset_detector.target_path_list = ['/model/other']
+        event_charset_detector.receive_atom(log_atom_1)
+        self.assertEqual(test_handler.anomaly, {'AnalysisComponent': {'AffectedLogAtomPaths': ['/model/other'],
+                                                                      'AffectedLogAtomValues': ['xyz'],
+                                                                      'MissingCharacters': ['x', 'y', 'z']}})
+
+        # Changing the ignore_list also skips atoms with the new ignore paths.
+        event_charset_detector.ignore_list = ['/model/value']
+        test_handler.anomaly = None
+        m_3 = MatchElement('/model/other', b'uvw', b'uvw', None)
+        log_atom_2 = LogAtom(b'abcuvw', ParserMatch(MatchElement('/model', b'abcuvw', b'abcuvw', [m_1, m_3])), 2, None)
+        event_charset_detector.receive_atom(log_atom_2)
+        self.assertIsNone(test_handler.anomaly)
+
 
 if __name__ == "__main__":
     unittest.main()
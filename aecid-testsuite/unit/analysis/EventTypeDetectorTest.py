@@ -206,6 +206,76 @@ class EventTypeDetectorTest(TestBase):
         self.assertEqual(event_type_detector.check_variables, event_type_detector_loaded.check_variables)
         self.assertEqual(event_type_detector.num_event_lines, event_type_detector_loaded.num_event_lines)
 
+    def test7receive_atoms_with_id_path_list(self):
+        """This unittest checks that log atoms with the same id tuple are assigned to the same event type."""
+        event_type_detector = EventTypeDetector(
+            self.aminer_config, [self.stream_printer_event_handler], id_path_list=['parser/type/path/name'])
+        current_indices = []
+        for line in self.log_lines:
+            log_atom = LogAtom(line, ParserMatch(self.parsing_model.get_match_element('parser', MatchContext(line))), time.time(),
+                               self.__class__.__name__)
+            if event_type_detector.receive_atom(log_atom):
+                current_indices.append(event_type_detector.current_index)
+        self.assertEqual(current_indices, [0, 1, 2, 0, 1, 3, 4, 5, 2, 0])
+        self.assertEqual(event_type_detector.id_path_list_tuples, [('one',), ('two',), ('three',), ('five',), ('four',), ('six',)])
+        self.assertEqual(event_type_detector.num_events, 6)
+
+        event_type_detector.do_persist()
+        event_type_detector_loaded = EventTypeDetector(
+            self.aminer_config, [self.stream_printer_event_handler], id_path_list=['parser/type/path/name'])
+        line = self.log_lines[-3]
+        log_atom = LogAtom(line, ParserMatch(self.parsing_model.get_match_element('parser', MatchContext(line))), time.time(),
+                           self.__class__.__name__)
+        self.assertTrue(event_type_detector_loaded.receive_atom(log_atom))
+        self.assertEqual(event_type_detector_loaded.current_index, 2)
+        self.assertEqual(event_type_detector_loaded.num_events, 6)
+
+    def test8append_values_string_variable(self):
+        """This unittest checks that the float conversion is skipped for variables, which only had string values so far."""
+        event_type_detector = EventTypeDetector(self.aminer_config, [self.stream_printer_event_handler])
+        t = time.time()
+        for _ in range(event_type_detector.num_string_values_thres):
+            log_atom = LogAtom(b'string', ParserMatch(MatchElement('path', b'string', b'string', None)), t, self.__class__.__name__)
+            self.assertTrue(event_type_detector.receive_atom(log_atom))
+        log_atom = LogAtom(b'22', ParserMatch(MatchElement('path', b'22', b'22', None)), t, self.__class__.__name__)
+        self.assertTrue(event_type_detector.receive_atom(log_atom))
+        self.assertEqual(event_type_detector.values, [[['string'] * event_type_detector.num_string_values_thres + ['22']]])
+
+        # The numbers of string values are persisted, so the float conversion is still skipped after loading the persistence.
+        event_type_detector.do_persist()
+        event_type_detector_loaded = EventTypeDetector(self.aminer_config, [self.stream_printer_event_handler])
+        self.assertEqual(event_type_detector.num_string_values, event_type_detector_loaded.num_string_values)
+        log_atom = LogAtom(b'23', ParserMatch(MatchElement('path', b'23', b'23', None)), t, self.__class__.__name__)
+        self.assertTrue(event_type_detector_loaded.receive_atom(log_atom))
+        self.assertEqual(event_type_detector_loaded.values, [[['string'] * event_type_detector.num_string_values_thres + ['22', '23']]])
+
+        # Variables with at least one float value keep trying the conversion.
+        event_type_detector = EventTypeDetector(self.aminer_config, [self.stream_printer_event_handler], persistence_id='Other')
+        log_atom = LogAtom(b'22', ParserMatch(MatchElement('path', b'22', b'22', None)), t, self.__class__.__name__)
+        self.assertTrue(event_type_detector.receive_atom(log_atom))
+        for _ in range(event_type_detector.num_string_values_thres):
+            log_atom = LogAtom(b'string', ParserMatch(MatchElement('path', b'string', b'string', None)), t, self.__class__.__name__)
+            self.assertTrue(event_type_detector.receive_atom(log_atom))
+        log_atom = LogAtom(b'22', ParserMatch(MatchElement('path', b'22', b'22', None)), t, self.__class__.__name__)
+        self.assertTrue(event_type_detector.receive_atom(log_atom))
+        self.assertEqual(event_type_detector.values, [[[22.0] + ['string'] * event_type_detector.num_string_values_thres + [22.0]]])
+
+    def test9change_target_path_list(self):
+        """This unittest checks that a changed target_path_list is used, e.g., after changing it with the remote control."""
+        event_type_detector = EventTypeDetector(
+            self.aminer_config, [self.stream_printer_event_handler], target_path_list=['parser/type/path/nametype'])
+        log_atoms = []
+        for line in self.log_lines[:2]:
+            log_atoms.append(LogAtom(line, ParserMatch(self.parsing_model.get_match_element('parser', MatchContext(line))), time.time(),
+                                     self.__class__.__name__))
+        self.assertFalse(event_type_detector.receive_atom(log_atoms[0]))
+        self.assertTrue(event_type_detector.receive_atom(log_atoms[1]))
+
+        event_type_detector.target_path_list = ['parser/type/syscall/syscall']
+        self.assertTrue(event_type_detector.receive_atom(log_atoms[0]))
+        self.assertFalse(event_type_detector.receive_atom(log_atoms[1]))
+        self.assertEqual(event_type_detector.variable_key_list[-1], ['parser/type/syscall/syscall'])
+
 
 if __name__ == "__main__":
     unittest.main()
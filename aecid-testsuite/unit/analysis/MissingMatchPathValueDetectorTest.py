@@ -8,6 +8,7 @@ import time
 from aminer.parsing.DecimalIntegerValueModelElement import DecimalIntegerValueModelElement
 from aminer.parsing.SequenceModelElement import SequenceModelElement
 from aminer.parsing.FirstMatchModelElement import FirstMatchModelElement
+from aminer.parsing.MatchElement import MatchElement
 from unit.TestBase import TestBase
 from datetime import datetime, timezone
 
@@ -400,6 +401,126 @@ class MissingMatchPathValueDetectorTest(TestBase):
               "service1', 'host1 ', 'service1']\" overdue 12s (interval 480)\n\n"
         self.assertEqual(msg, self.output_stream.getvalue())
 
+    def test13check_timeouts_realert(self):
+        """Test that only overdue values are reported and that they are not reported again before the realert interval passed."""
+        description = "Test13MissingMatchPathValueDetector"
+        missing_match_path_value_detector = MissingMatchPathValueDetector(self.aminer_config, ['/model/value'], [
+            self.stream_printer_event_handler], 'Default', True, 100, 1000, output_logline=False)
+        self.analysis_context.register_component(missing_match_path_value_detector, description)
+
+        def get_log_atom(value, timestamp):
+            match_element = MatchElement('/model/value', value, value, None)
+            parser_match = ParserMatch(MatchElement('/model', value, value, [match_element]))
+            return LogAtom(value, parser_match, timestamp, missing_match_path_value_detector)
+
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'a', 1))
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'b', 1))
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'a', 90))
+        self.assertEqual(self.output_stream.getvalue(), '')
+
+        # only the value b is overdue.
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'a', 150))
+        self.assertIn("['/model/value']: \"['b']\" overdue 49s (interval 100)", self.output_stream.getvalue())
+        self.assertNotIn("['a']", self.output_stream.getvalue())
+        self.reset_output_stream()
+
+        # the value b must not be reported again before the realert interval passed.
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'a', 180))
+        self.assertEqual(self.output_stream.getvalue(), '')
+
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'b', 1200))
+        self.assertIn("['/model/value']: \"['b']\" overdue 1099s (interval 100)", self.output_stream.getvalue())
+        self.assertIn("['/model/value']: \"['a']\" overdue 920s (interval 100)", self.output_stream.getvalue())
+        self.reset_output_stream()
+
+        # the value b was seen again, so it is back in normal state.
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'b', 1250))
+        self.assertEqual(self.output_stream.getvalue(), '')
+
+    def test14mixed_value_types_with_equal_check_times(self):
+        """Test that bytes and str values with equal check times can be scheduled and loaded from persistence."""
+        description = "Test14MissingMatchPathValueDetector"
+        missing_match_path_value_detector = MissingMatchPathValueDetector(self.aminer_config, ['/model/value'], [
+            self.stream_printer_event_handler], 'Default', True, 100, 1000, output_logline=False, combine_values=False)
+        self.analysis_context.register_component(missing_match_path_value_detector, description)
+        missing_match_path_value_detector.set_check_value(b'x', 100, '/model/value')
+        missing_match_path_value_detector.set_check_value('y', 100, '/model/value')
+        self.assertEqual(missing_match_path_value_detector.expected_values_dict, {
+            b'x': [0, 100, 0, '/model/value'], 'y': [0, 100, 0, '/model/value']})
+        missing_match_path_value_detector.do_persist()
+
+        other_missing_match_path_value_detector = MissingMatchPathValueDetector(self.aminer_config, ['/model/value'], [
+            self.stream_printer_event_handler], 'Default', True, 100, 1000, output_logline=False, combine_values=False)
+        self.analysis_context.register_component(other_missing_match_path_value_detector, description + "2")
+        self.assertEqual(other_missing_match_path_value_detector.expected_values_dict, {
+            b'x': [0, 100, 0, '/model/value'], 'y': [0, 100, 0, '/model/value']})
+
+        # both values are reported when they are overdue.
+        match_element = MatchElement('/model/value', b'z', b'z', None)
+        log_atom = LogAtom(b'z', ParserMatch(MatchElement('/model', b'z', b'z', [match_element])), 200,
+                           other_missing_match_path_value_detector)
+        other_missing_match_path_value_detector.check_timeouts(200, log_atom)
+        self.assertIn("/model/value: x overdue 100s (interval 100)", self.output_stream.getvalue())
+        self.assertIn("/model/value: 'y' overdue 100s (interval 100)", self.output_stream.getvalue())
+
+    def test15out_of_order_timestamps(self):
+        """Test that a value seen again with an older timestamp is checked at the earlier check time."""
+        description = "Test15MissingMatchPathValueDetector"
+        missing_match_path_value_detector = MissingMatchPathValueDetector(self.aminer_config, ['/model/value'], [
+            self.stream_printer_event_handler], 'Default', True, 100, 1000, output_logline=False)
+        self.analysis_context.register_component(missing_match_path_value_detector, description)
+
+        def get_log_atom(value, timestamp):
+            match_element = MatchElement('/model/value', value, value, None)
+            parser_match = ParserMatch(MatchElement('/model', value, value, [match_element]))
+            return LogAtom(value, parser_match, timestamp, missing_match_path_value_detector)
+
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'a', 1))
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'b', 1))
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'a', 90))
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'b', 95))
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'a', 150))
+        # the value a is seen again with an older timestamp, so it is overdue at 170 instead of 250.
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'a', 70))
+        self.assertEqual(self.output_stream.getvalue(), '')
+
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'b', 180))
+        self.assertIn("['/model/value']: \"['a']\" overdue 10s (interval 100)", self.output_stream.getvalue())
+        self.assertNotIn("['b']", self.output_stream.getvalue())
+
+    def test16change_target_path_list(self):
+        """Test that a changed target_path_list is used, e.g., after changing it with the remote control."""
+        description = "Test16MissingMatchPathValueDetector"
+
+        class TestHandler:
+            """Dummy anomaly handler storing the event data."""
+
+            event_data = None
+
+            # skipcq: PYL-W0613
+            def receive_event(self, name, msg, ll, event_data, atom, obj):
+                """Receive anomaly information."""
+                self.event_data = event_data
+
+        test_handler = TestHandler()
+        missing_match_path_value_detector = MissingMatchPathValueDetector(self.aminer_config, ['/model/value'], [
+            self.stream_printer_event_handler, test_handler], 'Default', True, 100, 1000, output_logline=False)
+        self.analysis_context.register_component(missing_match_path_value_detector, description)
+
+        def get_log_atom(value, timestamp):
+            match_element = MatchElement('/model/other', value, value, None)
+            parser_match = ParserMatch(MatchElement('/model', value, value, [match_element]))
+            return LogAtom(value, parser_match, timestamp, missing_match_path_value_detector)
+
+        self.assertFalse(missing_match_path_value_detector.receive_atom(get_log_atom(b'a', 1)))
+        missing_match_path_value_detector.target_path_list = ['/model/other']
+        self.assertTrue(missing_match_path_value_detector.receive_atom(get_log_atom(b'a', 1)))
+        self.assertEqual(missing_match_path_value_detector.expected_values_dict, {"['a']": [1, 100, 0, "['/model/other']"]})
+
+        missing_match_path_value_detector.receive_atom(get_log_atom(b'b', 150))
+        self.assertIn("['/model/other']: \"['a']\" overdue 49s (interval 100)", self.output_stream.getvalue())
+        self.assertEqual(test_handler.event_data['AnalysisComponent']['AffectedLogAtomPaths'], ['/model/other'])
+
 
 if __name__ == "__main__":
     unittest.main()
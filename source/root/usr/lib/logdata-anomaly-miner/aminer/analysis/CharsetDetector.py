@@ -56,76 +56,109 @@ class CharsetDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, Eve
             stop_learning_time=stop_learning_time, output_logline=output_logline, ignore_list=ignore_list,
             stop_learning_no_anomaly_time=stop_learning_no_anomaly_time, target_path_list=target_path_list, constraint_list=constraint_list
         )
+        # Copies of the path lists, which are compared to the current lists to rebuild the path caches when the lists are changed.
+        self.cached_path_lists = None
+        self.ignore_set, self.constraint_set, self.single_target_path = [None]*3
+        self.update_path_caches()
 
         # Persisted data stores characters as bytes for each id, i.e., [[[<id1, id2, ...>], [<byte1, byte2, ...>]], ...]]
         self.charsets = {}
+        # Decoded string of every single byte value for the output of missing characters. Bytes, which can not be decoded on their own
+        # with the configured encoding, are represented by their escape sequence.
+        self.decoded_bytes = tuple(bytes([byte]).decode(AminerConfig.ENCODING, 'backslashreplace') for byte in range(256))
+        # The charsets as bytes objects, which are used to delete all known characters from the values with bytes.translate().
+        self.charset_bytes = {}
         self.persistence_file_name = AminerConfig.build_persistence_file_name(aminer_config, self.__class__.__name__, persistence_id)
         PersistenceUtil.add_persistable_component(self)
         persistence_data = PersistenceUtil.load_json(self.persistence_file_name)
         if persistence_data is not None:
             for lst in persistence_data:
                 self.charsets[tuple(lst[0])] = set(lst[1])
+            self.charset_bytes = {id_event: bytes(charset) for id_event, charset in self.charsets.items()}
+
+    def update_path_caches(self):
+        """Build the sets of the ignore and constraint paths and the single target path from the current path lists."""
+        self.cached_path_lists = (list(self.target_path_list), list(self.id_path_list), list(self.ignore_list), list(self.constraint_list))
+        # Sets of the ignore and constraint paths for fast membership tests.
+        self.ignore_set = frozenset(self.ignore_list)
+        self.constraint_set = frozenset(self.constraint_list)
+        # The only target path, if there is exactly one and no id paths are used. None otherwise.
+        self.single_target_path = None
+        if len(self.target_path_list) == 1 and not self.id_path_list:
+            self.single_target_path = self.target_path_list[0]
 
     def receive_atom(self, log_atom):
         """Receive a log atom from a source."""
         self.log_total += 1
         parser_match = log_atom.parser_match
+        match_dict = parser_match.get_match_dictionary()
         if self.learn_mode is True and self.stop_learning_timestamp is not None and \
                 self.stop_learning_timestamp < log_atom.atom_time:
             logging.getLogger(DEBUG_LOG_NAME).info(f"Stopping learning in the {self.__class__.__name__}.")
             self.learn_mode = False
 
+        # The lists can be replaced at runtime, e.g., by the remote control.
+        if self.cached_path_lists != (self.target_path_list, self.id_path_list, self.ignore_list, self.constraint_list):
+            self.update_path_caches()
+
         # Skip atom when ignore paths in atom or constraint paths not in atom.
-        all_paths_set = set(parser_match.get_match_dictionary().keys())
-        if len(all_paths_set.intersection(self.ignore_list)) > 0 or \
-                len(all_paths_set.intersection(self.constraint_list)) != len(self.constraint_list):
+        all_paths = match_dict.keys()
+        if not all_paths.isdisjoint(self.ignore_set) or not all_paths >= self.constraint_set:
             return
 
-        # Store all values from target paths in a list.
-        values = []
-        all_values_none = True
-        for path in self.target_path_list:
-            match = parser_match.get_match_dictionary().get(path)
+        if self.single_target_path is not None:
+            # Shortcut for the common case of a single target path without id paths.
+            match = match_dict.get(self.single_target_path)
             if match is None:
-                continue
-            matches = []
+                return
             if isinstance(match, list):
-                matches = match
+                values = [element.match_object for element in match]
+                if all(value is None for value in values):
+                    return
+            elif match.match_object is None:
+                return
             else:
-                matches.append(match)
-            for match in matches:
-                value = match.match_object
-                if value is not None:
-                    all_values_none = False
-                values.append(value)
-        if all_values_none is True:
-            return
+                values = [match.match_object]
+            id_event = ()
+        else:
+            # Store all values from target paths in a list.
+            values = []
+            all_values_none = True
+            for path in self.target_path_list:
+                match = match_dict.get(path)
+                if match is None:
+                    continue
+                matches = match if isinstance(match, list) else (match,)
+                for match in matches:
+                    value = match.match_object
+                    if value is not None:
+                        all_values_none = False
+                    values.append(value)
+            if all_values_none is True:
+                return
 
-        # Store all values from id paths in a list. Use empty list as default path if not applicable.
-        id_vals = []
-        for path in self.id_path_list:
-            match = parser_match.get_match_dictionary().get(path)
-            if match is None:
-                continue
-            matches = []
-            if isinstance(match, list):
-                matches = match
-            else:
-                matches.append(match)
-            for match in matches:
-                if isinstance(match.match_object, bytes):
-                    value = match.match_object.decode(AminerConfig.ENCODING)
-                else:
-                    value = str(match.match_object)
-                id_vals.append(value)
-        id_event = tuple(id_vals)
+            # Store all values from id paths in a list. Use empty list as default path if not applicable.
+            id_vals = []
+            for path in self.id_path_list:
+                match = match_dict.get(path)
+                if match is None:
+                    continue
+                matches = match if isinstance(match, list) else (match,)
+                for match in matches:
+                    if isinstance(match.match_object, bytes):
+                        value = match.match_object.decode(AminerConfig.ENCODING)
+                    else:
+                        value = str(match.match_object)
+                    id_vals.append(value)
+            id_event = tuple(id_vals)
 
         # Check if one of the values has new characters for a specific id path.
+        if len(values) == 1:
+            joined = values[0]
+        else:
+            joined = b''.join(values)
         if id_event in self.charsets:
-            missing_chars = set()
-            for c in b''.join(values):
-                if c not in self.charsets[id_event]:
-                    missing_chars.add(c)
+            missing_chars = set(joined.translate(None, self.charset_bytes[id_event]))
             if len(missing_chars) > 0:
                 try:
                     data = log_atom.raw_data.decode(AminerConfig.ENCODING)
@@ -138,9 +171,7 @@ class CharsetDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, Eve
                                         data]
                 else:
                     sorted_log_lines = [data]
-                missing_chars_decoded = []
-                for character in missing_chars:
-                    missing_chars_decoded.append(character.to_bytes(1, 'big').decode(AminerConfig.ENCODING))
+                missing_chars_decoded = [self.decoded_bytes[character] for character in missing_chars]
                 affected_values = []
                 for value in values:
                     affected_values.append(value.decode(AminerConfig.ENCODING))
@@ -152,11 +183,14 @@ class CharsetDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, Eve
                                            event_data, log_atom, self)
             # Extend charsets if learn mode is active.
             if self.learn_mode:
-                self.charsets[id_event].update(missing_chars)
+                if missing_chars:
+                    self.charsets[id_event].update(missing_chars)
+                    self.charset_bytes[id_event] = bytes(self.charsets[id_event])
                 if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
                     self.stop_learning_timestamp = time.time() + self.stop_learning_no_anomaly_time
         else:
-            self.charsets[id_event] = set(b''.join(values))
+            self.charsets[id_event] = set(joined)
+            self.charset_bytes[id_event] = bytes(self.charsets[id_event])
         self.log_success += 1
 
     def do_timer(self, trigger_time):
@@ -195,6 +229,7 @@ class CharsetDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, Eve
             raise Exception(msg)
         if event_data not in self.constraint_list:
             self.constraint_list.append(event_data)
+            self.update_path_caches()
         return f'Allowlisted path {event_data}.'
 
     def blocklist_event(self, event_type, event_data, blocklisting_data):
@@ -213,6 +248,7 @@ class CharsetDetector(AtomHandlerInterface, TimeTriggeredComponentInterface, Eve
             raise Exception(msg)
         if event_data not in self.ignore_list:
             self.ignore_list.append(event_data)
+            self.update_path_caches()
         return f'Blocklisted path {event_data}.'
 
     def log_statistics(self, component_name):
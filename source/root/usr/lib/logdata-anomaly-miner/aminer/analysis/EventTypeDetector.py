@@ -19,6 +19,7 @@ from aminer import AminerConfig
 from aminer.AminerConfig import build_persistence_file_name, KEY_PERSISTENCE_PERIOD, DEFAULT_PERSISTENCE_PERIOD, DEBUG_LOG_NAME
 from aminer.AnalysisChild import AnalysisContext
 from aminer.input.InputInterfaces import AtomHandlerInterface
+from aminer.parsing.MatchElement import MatchElement
 from aminer.util.TimeTriggeredComponentInterface import TimeTriggeredComponentInterface
 from aminer.util import PersistenceUtil
 
@@ -27,6 +28,8 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
     """This class keeps track of the found event types and the values of each variable."""
 
     time_trigger_class = AnalysisContext.TIME_TRIGGER_CLASS_REALTIME
+    # Number of leading values of a variable, which can not be converted to floats, before the conversion is not tried anymore.
+    num_string_values_thres = 10
 
     def __init__(self, aminer_config, anomaly_event_handlers, persistence_id='Default', target_path_list=None, id_path_list=None,
                  allow_missing_id=False, allowed_id_tuples=None, min_num_vals=1000, max_num_vals=1500, save_values=True):
@@ -54,9 +57,12 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
             max_num_vals=max_num_vals, save_values=save_values
         )
 
+        # Set of the target paths for fast membership tests and the copy of the target paths it was built from.
+        self.target_path_set, self.cached_target_path_list = None, None
+        self.update_target_path_set()
         self.num_events = 0
         self.longest_path = []  # List of the longest path of the events
-        self.found_keys = []  # List of the keys corresponding to the events
+        self.found_keys = []  # List of the frozensets of keys corresponding to the events
         self.variable_key_list = []  # List of the keys, which take values in the log line
         # List of the values of the log lines. If the length reaches max_num_vals the list gets reduced to min_num_vals values per variable
         self.values = []
@@ -66,6 +72,8 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         # [VariableTypeDetector, VariableCorrelationDetector, TSAArimaDetector]
         self.following_modules = []
         self.check_variables = []  # List of bools, which state if the variables of variable_key_list are updated.
+        # List of the numbers of leading values of the variables, which could not be converted to floats. -1 after the first float.
+        self.num_string_values = []
         # List ot the time trigger. The first list states the times when something should be triggered, the second list states the indices
         # of the event types, or a list of the event type, a path and a value which should be counted (-1 for an initialization)
         # the third list states, the length of the time step (-1 for a one time trigger)
@@ -73,6 +81,8 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         self.num_event_lines_tsa_ref = []  # Reference containing the number of lines of the events for the TSA
         self.current_index = 0  # Index of the event type of the current log line
         self.id_path_list_tuples = []  # List of the id tuples
+        self.id_tuple_indices = {}  # Dictionary mapping the id tuples to the indices of the event types
+        self.found_keys_indices = {}  # Dictionary mapping the found keys to the indices of the event types
 
         # Loads the persistence
         self.persistence_file_name = build_persistence_file_name(aminer_config, self.__class__.__name__, persistence_id)
@@ -82,7 +92,7 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         # Imports the persistence
         if persistence_data is not None:
             for key in persistence_data[0]:
-                self.found_keys.append(set(key))
+                self.found_keys.append(frozenset(key))
             self.variable_key_list = persistence_data[1]
             self.values = persistence_data[2]
             self.longest_path = persistence_data[3]
@@ -90,29 +100,43 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
             self.num_event_lines = persistence_data[5]
             self.id_path_list_tuples = [tuple(tuple_list) for tuple_list in persistence_data[6]]
 
+            # Persistence files of older versions do not contain the numbers of string values.
+            if len(persistence_data) > 7:
+                self.num_string_values = persistence_data[7]
+            else:
+                self.num_string_values = [[0] * len(var_keys) for var_keys in self.variable_key_list]
+
             self.num_events = len(self.found_keys)
+            self.id_tuple_indices = {id_tuple: event_index for event_index, id_tuple in enumerate(self.id_path_list_tuples)}
+            self.found_keys_indices = {keys: event_index for event_index, keys in enumerate(self.found_keys)}
+
+    def update_target_path_set(self):
+        """Build the set of the target paths from the current target_path_list."""
+        if self.target_path_list is None:
+            self.target_path_set, self.cached_target_path_list = None, None
+        else:
+            self.target_path_set, self.cached_target_path_list = frozenset(self.target_path_list), list(self.target_path_list)
 
     def receive_atom(self, log_atom):
         """Receives a parsed atom and keeps track of the event types and the values of the variables of them."""
         self.log_total += 1
-        valid_log_atom = False
-        if self.target_path_list:
-            for path in self.target_path_list:
-                if path in log_atom.parser_match.get_match_dictionary().keys():
-                    valid_log_atom = True
-                    break
-        if self.target_path_list and not valid_log_atom:
+        match_dict = log_atom.parser_match.get_match_dictionary()
+        # The target paths can be replaced at runtime, e.g., by the remote control.
+        if self.cached_target_path_list != self.target_path_list:
+            self.update_target_path_set()
+        if self.target_path_list and match_dict.keys().isdisjoint(self.target_path_set):
             self.current_index = -1
             return False
         self.total_records += 1
 
         # Get the current index, either from the combination of values of the paths of id_path_list, or the event type
+        match_keys = None
         if self.id_path_list:
             # In case that id_path_list is set, use it to differentiate sequences by their id.
             # Otherwise, the empty tuple () is used as the only key of the current_sequences dict.
             id_tuple = ()
             for id_path in self.id_path_list:
-                id_match = log_atom.parser_match.get_match_dictionary().get(id_path)
+                id_match = match_dict.get(id_path)
                 if id_match is None:
                     if self.allow_missing_id is True:
                         # Insert placeholder for id_path that is not available
@@ -132,34 +156,26 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
                 return False
 
             # Searches if the id_tuple has previously appeared
-            current_index = -1
-            for event_index, var_key in enumerate(self.id_path_list_tuples):
-                if id_tuple == var_key:
-                    current_index = event_index
+            current_index = self.id_tuple_indices.get(id_tuple, -1)
         else:
             # Searches if the event type has previously appeared
-            current_index = -1
-            for event_index in range(self.num_events):
-                if self.longest_path[event_index] in log_atom.parser_match.get_match_dictionary() and set(
-                        log_atom.parser_match.get_match_dictionary()) == self.found_keys[event_index]:
-                    current_index = event_index
+            match_keys = frozenset(match_dict)
+            current_index = self.found_keys_indices.get(match_keys, -1)
+            if current_index != -1 and self.longest_path[current_index] not in match_dict:
+                current_index = -1
 
         # Initialize a new event type if the event type of the new line has not appeared
         if current_index == -1:
             current_index = self.num_events
             self.num_events += 1
-            self.found_keys.append(set(log_atom.parser_match.get_match_dictionary().keys()))
+            if match_keys is None:
+                match_keys = frozenset(match_dict)
+            self.found_keys.append(match_keys)
 
-            # Initialize the list of the keys to the variables
-            self.variable_key_list.append(list(self.found_keys[current_index]))
-            # Delete the entries with value None or timestamps as values
-            for var_index in range(len(self.variable_key_list[current_index]) - 1, -1, -1):
-                if (type(log_atom.parser_match.get_match_dictionary()[self.variable_key_list[current_index][var_index]]).__name__ !=
-                        'MatchElement') or (log_atom.parser_match.get_match_dictionary()[self.variable_key_list[
-                        current_index][var_index]].match_object is None):
-                    del self.variable_key_list[current_index][var_index]
-                elif (self.target_path_list is not None) and self.variable_key_list[current_index][var_index] not in self.target_path_list:
-                    del self.variable_key_list[current_index][var_index]
+            # Initialize the list of the keys to the variables. Omit the entries with value None or timestamps as values
+            self.variable_key_list.append([
+                var_key for var_key in match_keys if isinstance(match_dict[var_key], MatchElement) and
+                match_dict[var_key].match_object is not None and (self.target_path_set is None or var_key in self.target_path_set)])
 
             # Initialize the empty lists for the values and initialize the check_variables list for the variables
             if self.save_values:
@@ -168,6 +184,7 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
             self.num_event_lines.append(0)
 
             if not self.id_path_list:
+                self.found_keys_indices[match_keys] = current_index
                 # String of the longest found path
                 self.longest_path.append('')
                 # Number of forward slashes in the longest path
@@ -180,7 +197,7 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
                                 self.longest_path[current_index] = var_key
                                 tmp_int = count
                 else:
-                    for found_key in list(self.found_keys[current_index]):
+                    for found_key in match_keys:
                         if found_key is None:
                             found_key = ""
                         count = found_key.count('/')
@@ -189,6 +206,7 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
                             tmp_int = count
             else:
                 self.id_path_list_tuples.append(id_tuple)
+                self.id_tuple_indices[id_tuple] = current_index
         self.current_index = current_index
 
         if self.save_values:
@@ -221,6 +239,7 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
         tmp_list.append(self.check_variables)
         tmp_list.append(self.num_event_lines)
         tmp_list.append(self.id_path_list_tuples)
+        tmp_list.append(self.num_string_values)
         PersistenceUtil.store_json(self.persistence_file_name, tmp_list)
 
         logging.getLogger(DEBUG_LOG_NAME).debug(f'{self.__class__.__name__} persisted data.')
@@ -238,48 +257,48 @@ class EventTypeDetector(AtomHandlerInterface, TimeTriggeredComponentInterface):
             self.values = [[[] for _ in range(len(self.variable_key_list[current_index]))]]
         else:
             self.values.append([[] for _ in range(len(self.variable_key_list[current_index]))])
+        self.num_string_values.append([0] * len(self.variable_key_list[current_index]))
 
     def append_values(self, log_atom, current_index):
         """Add the values of the variables of the current line to self.values."""
+        match_dict = log_atom.parser_match.get_match_dictionary()
+        values = self.values[current_index]
+        check_variables = self.check_variables[current_index]
+        num_string_values = self.num_string_values[current_index]
         for var_index, var_key in enumerate(self.variable_key_list[current_index]):
             # Skips the variable if check_variable is False, or if the var_key is not included in the match_dict
-            if not self.check_variables[current_index][var_index]:
+            if not check_variables[var_index]:
                 continue
-            if var_key not in log_atom.parser_match.get_match_dictionary():
-                self.values[current_index][var_index] = []
-                self.check_variables[current_index][var_index] = False
+            match = match_dict.get(var_key)
+            if match is None:
+                values[var_index] = []
+                check_variables[var_index] = False
                 continue
 
-            raw_match_object = ''
-            if isinstance(log_atom.parser_match.get_match_dictionary()[var_key].match_object, bytearray):
-                raw_match_object = repr(
-                    bytes(log_atom.parser_match.get_match_dictionary()[var_key].match_object))[2:-1]
-            elif isinstance(log_atom.parser_match.get_match_dictionary()[var_key].match_object, bytes):
-                raw_match_object = repr(log_atom.parser_match.get_match_dictionary()[var_key].match_object)[2:-1]
-
-            # Try to convert the values to floats and add them as values
-            try:
-                if raw_match_object != '':
-                    self.values[current_index][var_index].append(float(raw_match_object))
-                else:
-                    self.values[current_index][var_index].append(
-                        float(log_atom.parser_match.get_match_dictionary()[var_key].match_object))
+            # Try to convert the values to floats and add them as values, unless the variable only had string values so far.
+            # float() parses bytes and bytearrays directly, so they do not have to be converted to strings first.
+            if num_string_values[var_index] < self.num_string_values_thres:
+                try:
+                    values[var_index].append(float(match.match_object))
+                    num_string_values[var_index] = -1
+                    continue
+                except:  # skipcq: FLK-E722
+                    if num_string_values[var_index] != -1:
+                        num_string_values[var_index] += 1
             # Add the strings as values
-            except:  # skipcq: FLK-E722
-                if isinstance(log_atom.parser_match.get_match_dictionary()[var_key].match_string, bytes):
-                    self.values[current_index][var_index].append(
-                        repr(log_atom.parser_match.get_match_dictionary()[var_key].match_string)[2:-1])
-                else:
-                    self.values[current_index][var_index].append(log_atom.parser_match.get_match_dictionary()[var_key].match_string)
+            if isinstance(match.match_string, bytes):
+                values[var_index].append(repr(match.match_string)[2:-1])
+            else:
+                values[var_index].append(match.match_string)
 
         # Reduce the numbers of entries in the value list
-        if len(self.variable_key_list[current_index]) > 0 and len([i for i in self.check_variables[current_index] if i]) > 0 and \
-                len(self.values[current_index][self.check_variables[current_index].index(True)]) > self.max_num_vals:
+        if len(self.variable_key_list[current_index]) > 0 and True in check_variables and \
+                len(values[check_variables.index(True)]) > self.max_num_vals:
             for var_index in range(len(self.variable_key_list[current_index])):  # skipcq: PTC-W0060
                 # Skips the variable if check_variable is False
-                if not self.check_variables[current_index][var_index]:
+                if not check_variables[var_index]:
                     continue
-                self.values[current_index][var_index] = self.values[current_index][var_index][-self.min_num_vals:]
+                del values[var_index][:-self.min_num_vals]
 
     def get_event_type(self, event_index):
         """Return a string which includes information about the event type."""
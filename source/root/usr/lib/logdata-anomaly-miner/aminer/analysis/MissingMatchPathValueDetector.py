@@ -13,6 +13,8 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 
 import time
 import logging
+import heapq
+import itertools
 
 from aminer.AminerConfig import build_persistence_file_name, DEBUG_LOG_NAME, KEY_PERSISTENCE_PERIOD, DEFAULT_PERSISTENCE_PERIOD,\
     STAT_LOG_NAME
@@ -62,10 +64,17 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
             output_logline=output_logline, combine_values=combine_values, stop_learning_time=stop_learning_time,
             stop_learning_no_anomaly_time=stop_learning_no_anomaly_time
         )
-        # This timestamp is compared with timestamp values from log atoms for activation of alerting logic. The first timestamp from logs
-        # above this value will trigger alerting.
-        self.next_check_timestamp = 0
+        # Min-heap of (check_time, sequence_number, value) tuples. A value has to be checked when the last seen timestamp reaches its check
+        # time. Entries are not removed from the heap when a check is rescheduled, so only entries matching the check time in check_times
+        # are valid. The sequence number breaks ties between equal check times, as values of different types can not be compared.
+        self.check_heap = []
+        self.check_counter = itertools.count()
+        self.check_times = {}
         self.last_seen_timestamp = 0
+        # Copy of the target paths, which is compared to target_path_list to rebuild the derived attributes when the list is changed.
+        self.cached_target_path_list = None
+        self.target_path_list_str, self.target_path_set = None, None
+        self.update_target_path_caches()
         self.log_learned_values = 0
         self.log_new_learned_values = []
 
@@ -74,18 +83,16 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
         persistence_data = PersistenceUtil.load_json(self.persistence_file_name)
         self.expected_values_dict = {}
         if persistence_data is not None:
-            for key in persistence_data:
-                value = persistence_data[key]
+            for key, value in persistence_data.items():
                 if self.target_path_list is not None:  # skipcq: PTC-W0048
                     if (value[3] not in self.target_path_list and not self.combine_values) or (
-                            value[3] != str(self.target_path_list) and self.combine_values):
+                            value[3] != self.target_path_list_str and self.combine_values):
                         continue
-                elif self.target_path_list is not None and value[3] not in self.target_path_list:
-                    continue
                 if value[1] != default_interval:
                     value[1] = default_interval
                     value[2] = value[0] + default_interval
                 self.expected_values_dict[key] = value
+                self.schedule_check(key, value)
             logging.getLogger(DEBUG_LOG_NAME).debug(f'{self.__class__.__name__} loaded persistence data.')
         self.analysis_string = 'Analysis.%s'
 
@@ -113,48 +120,56 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
         timestamp = log_atom.get_timestamp()
         if timestamp is None:
             timestamp = time.time()
-        for i, target_path in enumerate(target_paths):
-            value = value_list[i]
-            detector_info = self.expected_values_dict.get(value)
+        # The tracking records of the values are collected to update them after checking the timeouts without looking them up a second time.
+        detector_infos = []
+        expected_values_dict = self.expected_values_dict
+        for target_path, value in zip(target_paths, value_list):
+            detector_info = expected_values_dict.get(value)
             if detector_info is None and self.learn_mode:
-                self.expected_values_dict[value] = [timestamp, self.default_interval, 0, target_path]
-                self.next_check_timestamp = min(self.next_check_timestamp, timestamp + self.default_interval)
+                detector_info = [timestamp, self.default_interval, 0, target_path]
+                expected_values_dict[value] = detector_info
+                self.schedule_check(value, detector_info)
                 self.log_learned_values += 1
-                self.log_new_learned_values.append(value)
+                # The learned values are only logged with the statistics level 2, which can be changed at runtime.
+                if AminerConfig.STAT_LEVEL == 2:
+                    self.log_new_learned_values.append(value)
                 if self.stop_learning_timestamp is not None and self.stop_learning_no_anomaly_time is not None:
                     self.stop_learning_timestamp = time.time() + self.stop_learning_no_anomaly_time
+            if detector_info is not None:
+                detector_infos.append((value, detector_info))
 
-        self.check_timeouts(timestamp, log_atom)
+        # Only call check_timeouts when the first scheduled check is due, as this is rarely the case.
+        if self.check_heap and self.check_heap[0][0] <= max(self.last_seen_timestamp, timestamp):
+            self.check_timeouts(timestamp, log_atom)
+        elif timestamp > self.last_seen_timestamp:
+            self.last_seen_timestamp = timestamp
 
-        for i, target_path in enumerate(target_paths):
-            value = value_list[i]
-            detector_info = self.expected_values_dict.get(value)
-            if detector_info is not None:
-                # Just update the last seen value and switch from non-reporting error state to normal state.
-                detector_info[0] = timestamp
-                if detector_info[2] != 0:
-                    if timestamp >= detector_info[2]:
-                        detector_info[2] = 0
-                    # Delta of this detector might be lower than the default maximum recheck time.
-                    self.next_check_timestamp = min(self.next_check_timestamp, timestamp + detector_info[1])
+        check_times = self.check_times
+        for value, detector_info in detector_infos:
+            # Just update the last seen value and switch from non-reporting error state to normal state. Usually the check time moves
+            # forward, so the scheduled check is kept and rescheduled when it is reached. Only atoms with older timestamps move it back.
+            detector_info[0] = timestamp
+            if detector_info[2] != 0 and timestamp >= detector_info[2]:
+                detector_info[2] = 0
+            check_time = check_times.get(value)
+            if check_time is None or timestamp + detector_info[1] < check_time:
+                self.schedule_check(value, detector_info)
         self.log_success += 1
         return True
 
     def get_channel_key(self, log_atom):
         """Get the key identifying the channel this log_atom is coming from."""
+        match_dict = log_atom.parser_match.get_match_dictionary()
+        combine_values = self.combine_values
         value_list = []
         path_list = []
         for target_path in self.target_path_list:
-            match = log_atom.parser_match.get_match_dictionary().get(target_path)
+            match = match_dict.get(target_path)
             if match is None:
-                if self.combine_values:
+                if combine_values:
                     return None
                 continue
-            matches = []
-            if isinstance(match, list):
-                matches = match
-            else:
-                matches.append(match)
+            matches = match if isinstance(match, list) else (match,)
             for match in matches:
                 if isinstance(match.match_object, bytes):
                     affected_log_atom_values = match.match_object.decode(AminerConfig.ENCODING)
@@ -162,88 +177,95 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
                     affected_log_atom_values = match.match_object
                 value_list.append(str(affected_log_atom_values))
                 path_list.append(target_path)
-        if self.combine_values:
+        if combine_values:
             value_list = str(value_list)
-            path_list = str(path_list)
+            # Every target path occurs exactly once when no path matched multiple elements.
+            if len(path_list) == len(self.target_path_list):
+                if self.cached_target_path_list != self.target_path_list:
+                    self.update_target_path_caches()
+                path_list = self.target_path_list_str
+            else:
+                path_list = str(path_list)
         return path_list, value_list
 
+    def update_target_path_caches(self):
+        """Rebuild the string and the set of the target paths, as target_path_list can be replaced at runtime."""
+        self.cached_target_path_list = list(self.target_path_list)
+        # String representation of the target paths, which is used as target path of combined values.
+        self.target_path_list_str = str(self.target_path_list)
+        # Set of the target paths for fast membership tests.
+        self.target_path_set = frozenset(self.target_path_list)
+
     def check_timeouts(self, timestamp, log_atom):
         """Check if there was any timeout on a channel, thus triggering event dispatching."""
         old_last_seen_timestamp = self.last_seen_timestamp
-        self.last_seen_timestamp = max(self.last_seen_timestamp, timestamp)
-        if self.last_seen_timestamp > self.next_check_timestamp:
+        last_seen_timestamp = max(old_last_seen_timestamp, timestamp)
+        self.last_seen_timestamp = last_seen_timestamp
+        check_heap = self.check_heap
+        if check_heap and check_heap[0][0] <= last_seen_timestamp:
             missing_value_list = []
-            # Start with a large recheck interval. It will be lowered if any of the expectation intervals is below that.
-            if self.next_check_timestamp == 0:
-                self.next_check_timestamp = self.last_seen_timestamp + self.realert_interval
-            for value, detector_info in self.expected_values_dict.items():
-                value_overdue_time = int(self.last_seen_timestamp - detector_info[0] - detector_info[1])
-                if detector_info[2] != 0:
-                    next_check_delta = detector_info[2] - self.last_seen_timestamp
-                    if next_check_delta > 0:
-                        # Already alerted but not ready for realerting yet.
-                        self.next_check_timestamp = min(self.next_check_timestamp, detector_info[2])
-                        continue
-                else:
-                    # No alerting yet, see if alerting is required.
-                    if value_overdue_time < 0:
-                        old = self.next_check_timestamp
-                        self.next_check_timestamp = min(self.next_check_timestamp, self.last_seen_timestamp - value_overdue_time)
-                        if old > self.next_check_timestamp or self.next_check_timestamp < detector_info[2]:
-                            break
+            checked_values = []
+            check_times = self.check_times
+            expected_values_dict = self.expected_values_dict
+            next_alert_timestamp = last_seen_timestamp + self.realert_interval
+            while check_heap and check_heap[0][0] <= last_seen_timestamp:
+                check_time, _, value = heapq.heappop(check_heap)
+                if check_times.get(value) != check_time:
+                    # The check was rescheduled or the value was removed.
+                    continue
+                del check_times[value]
+                detector_info = expected_values_dict[value]
+                checked_values.append((value, detector_info))
+                if detector_info[2] > last_seen_timestamp:
+                    # Already alerted but not ready for realerting yet.
+                    continue
+                value_overdue_time = int(last_seen_timestamp - detector_info[0] - detector_info[1])
                 # avoid early re-alerting
                 if value_overdue_time > 0:
                     missing_value_list.append([detector_info[3], value, value_overdue_time, detector_info[1]])
                     # Set the next alerting time.
-                    detector_info[2] = self.last_seen_timestamp + self.realert_interval
-                    self.expected_values_dict[value] = detector_info
+                    detector_info[2] = next_alert_timestamp
                 # Workaround:
                 # also check for long gaps between same tokens where the last_seen_timestamp gets updated
                 # on the arrival of tokens following a longer gap
-                elif self.last_seen_timestamp - detector_info[0] > detector_info[1]:
-                    value_overdue_time = self.last_seen_timestamp - old_last_seen_timestamp - detector_info[1]
+                elif last_seen_timestamp - detector_info[0] > detector_info[1]:
+                    value_overdue_time = last_seen_timestamp - old_last_seen_timestamp - detector_info[1]
                     missing_value_list.append([detector_info[3], value, value_overdue_time, detector_info[1]])
                     # Set the next alerting time.
-                    detector_info[2] = self.last_seen_timestamp + self.realert_interval
-                    self.expected_values_dict[value] = detector_info
+                    detector_info[2] = next_alert_timestamp
+            # Reschedule the checks after popping all due entries, as the new check times might still be due.
+            for value, detector_info in checked_values:
+                self.schedule_check(value, detector_info)
             if missing_value_list:
                 message_part = []
                 affected_log_atom_values = []
+                # Subclasses report all target paths instead of the path of each value.
+                report_value_paths = self.__class__.__name__ == 'MissingMatchPathValueDetector'
+                target_paths = ', '.join(self.target_path_list)
                 for target_path_list, value, overdue_time, interval in missing_value_list:
                     e = {}
-                    try:
-                        if isinstance(value, list):
-                            data = []
-                            for val in value:
-                                if isinstance(val, bytes):
-                                    data.append(val.decode(AminerConfig.ENCODING))
-                                else:
-                                    data.append(val)
-                            data = str(data)
-                        else:
-                            if isinstance(value, bytes):
-                                data = value.decode(AminerConfig.ENCODING)
-                            else:
-                                data = repr(value)
-                    except UnicodeError:
+                    # Values are dictionary keys and therefore never lists. get_channel_key already decodes them to strings, only values
+                    # added with set_check_value might still be bytes.
+                    if isinstance(value, bytes):
+                        try:
+                            data = value.decode(AminerConfig.ENCODING)
+                        except UnicodeError:
+                            data = repr(value)
+                    else:
                         data = repr(value)
-                    if self.__class__.__name__ == 'MissingMatchPathValueDetector':
+                    if report_value_paths:
                         e['TargetPathList'] = target_path_list
                         message_part.append(f'  {target_path_list}: {data} overdue {overdue_time}s (interval {interval})\n')
                     else:
-                        target_paths = ''
-                        for target_path in self.target_path_list:
-                            target_paths += target_path + ', '
                         e['TargetPathList'] = self.target_path_list
-                        message_part.append(f'  {target_paths[:-2]}: {data} overdue {overdue_time}s (interval {interval})\n')
-                    e['Value'] = str(value)
+                        message_part.append(f'  {target_paths}: {data} overdue {overdue_time}s (interval {interval})\n')
+                    e['Value'] = repr(value) if isinstance(value, bytes) else str(value)
                     e['OverdueTime'] = str(overdue_time)
                     e['Interval'] = str(interval)
                     affected_log_atom_values.append(e)
-                affected_log_atom_paths = []
-                for path in log_atom.parser_match.get_match_dictionary().keys():
-                    if path in self.target_path_list:
-                        affected_log_atom_paths.append(path)
+                if self.cached_target_path_list != self.target_path_list:
+                    self.update_target_path_caches()
+                affected_log_atom_paths = [path for path in log_atom.parser_match.get_match_dictionary() if path in self.target_path_set]
                 analysis_component = {'AffectedLogAtomPaths': affected_log_atom_paths,
                                       'AffectedLogAtomValues': affected_log_atom_values}
                 event_data = {'AnalysisComponent': analysis_component}
@@ -256,14 +278,22 @@ class MissingMatchPathValueDetector(AtomHandlerInterface, TimeTriggeredComponent
         anomaly_event_handler.receive_event(self.analysis_string % self.__class__.__name__, 'Interval too large between values',
                                             message_part, event_data, log_atom, self)
 
+    def schedule_check(self, value, detector_info):
+        """Schedule the next check of a value, which is due when it is overdue and not waiting for realerting."""
+        check_time = max(detector_info[0] + detector_info[1], detector_info[2])
+        self.check_times[value] = check_time
+        heapq.heappush(self.check_heap, (check_time, next(self.check_counter), value))
+
     def set_check_value(self, value, interval, target_path):
         """Add or overwrite a value to be monitored by the detector."""
-        self.expected_values_dict[value] = [self.last_seen_timestamp, interval, 0, target_path]
-        self.next_check_timestamp = 0
+        detector_info = [self.last_seen_timestamp, interval, 0, target_path]
+        self.expected_values_dict[value] = detector_info
+        self.schedule_check(value, detector_info)
 
     def remove_check_value(self, value):
         """Remove checks for given value."""
         del self.expected_values_dict[value]
+        self.check_times.pop(value, None)
         logging.getLogger(DEBUG_LOG_NAME).debug(f'{self.__class__.__name__} removed check value {str(value)}.')
 
     def do_timer(self, trigger_time):
@@ -335,8 +365,9 @@ class MissingMatchPathListValueDetector(MissingMatchPathValueDetector):
 
     def get_channel_key(self, log_atom):
         """Get the key identifying the channel this log_atom is coming from."""
+        match_dict = log_atom.parser_match.get_match_dictionary()
         for target_path in self.target_path_list:
-            match_element = log_atom.parser_match.get_match_dictionary().get(target_path)
+            match_element = match_dict.get(target_path)
             if match_element is None:
                 continue
             if isinstance(match_element.match_object, bytes):
@@ -32,9 +32,12 @@ class ZmqEventHandler(EventHandlerInterface):
         self.analysis_context = analysis_context
         self.url = url
         self.topic = topic
+        # The topic is encoded once, as it is sent as first frame of every message.
+        self.topic_bytes = None
+        if topic:
+            self.topic_bytes = topic.encode()
         self.producer = None
         self.context = None
-        self.zmq_imported = False
         logging.getLogger(DEBUG_LOG_NAME).info("ZmqEventHandler initialized")
 
     def receive_event(self, _event_type, _event_message, _sorted_loglines, event_data, _log_atom, event_source):
@@ -57,36 +60,42 @@ class ZmqEventHandler(EventHandlerInterface):
         component_name = self.analysis_context.get_name_by_component(event_source)
         if component_name in self.analysis_context.suppress_detector_list:
             return True
-        if self.zmq_imported is False:
+        if self.producer is None:
+            # The socket is created on first use and recreated after send errors.
             try:
-                self.context = zmq.Context()
+                if self.context is None:
+                    self.context = zmq.Context()
                 self.producer = self.context.socket(zmq.PUB)
                 self.producer.bind(self.url)
                 logging.getLogger(DEBUG_LOG_NAME).info(f"Created socket on {self.url}")
-                self.zmq_imported = True
-            except ImportError:
-                msg = 'ZeroMQ module not found.'
+            except zmq.ZMQError as err:
+                msg = f'Could not create socket on {self.url}: {err}'
                 logging.getLogger(DEBUG_LOG_NAME).error(msg)
                 print('ERROR: ' + msg, file=sys.stderr)
+                if self.producer is not None:
+                    self.producer.close()
+                    self.producer = None
                 return False
         if not isinstance(event_data, str) and not isinstance(event_data, bytes):
             msg = 'ZmqEventHandler received non-string event data. Use the JsonConverterHandler to serialize it first.'
             logging.getLogger(DEBUG_LOG_NAME).warning(msg)
             print('WARNING: ' + msg, file=sys.stderr)
             return False
+        if isinstance(event_data, str):
+            event_data = event_data.encode()
         try:
-            if self.topic:
-                self.producer.send_string(self.topic, flags=zmq.SNDMORE)
             # please note that if the JsonConvertHandler was used(json: true)
             # then it is possible to use the socket.recv_json() for the
             # consumer. recv_json() will decode the json-string
-            self.producer.send_string(event_data)
+            if self.topic_bytes is not None:
+                self.producer.send_multipart([self.topic_bytes, event_data])
+            else:
+                self.producer.send(event_data)
         except zmq.ZMQError as err:
             msg = str(err)
             logging.getLogger(DEBUG_LOG_NAME).error(msg)
             print("Error: " + msg, file=sys.stderr)
-            self.producer.disconnect()
+            self.producer.close()
             self.producer = None
-            self.zmq_imported = False
             return False
         return True
@@ -32,7 +32,10 @@ def load_json(input_string):
 def encode_object(term):
     """@param term return an object encoded as string."""
     encoded_object = ''
-    if isinstance(term, str):
+    # Numbers are checked first, as they are the most common items in the persisted data.
+    if isinstance(term, (bool, int, float)) or term is None:
+        encoded_object = term
+    elif isinstance(term, str):
         encoded_object = 'string:' + term
     elif isinstance(term, bytes):
         encoded_object = 'bytes:' + encode_byte_string_as_string(term)
@@ -47,8 +50,6 @@ def encode_object(term):
                 key = encode_object(key)
             var = encode_object(var)
             encoded_object[key] = var
-    elif isinstance(term, (bool, int, float)) or term is None:
-        encoded_object = term
     else:
         msg = 'Unencodeable object %s' % type(term)
         logging.getLogger(DEBUG_LOG_NAME).error(msg)
@@ -59,11 +60,13 @@ def encode_object(term):
 def decode_object(term):
     """@param term return a string decoded as object structure."""
     decoded_object = ''
-    if isinstance(term, str) and term.startswith('string:'):
-        decoded_object = term[7:]
-    elif isinstance(term, str) and term.startswith('bytes:'):
-        decoded_object = term[6:]
-        decoded_object = decode_string_as_byte_string(decoded_object)
+    if isinstance(term, str):
+        if term.startswith('string:'):
+            decoded_object = term[7:]
+        elif term.startswith('bytes:'):
+            decoded_object = decode_string_as_byte_string(term[6:])
+        else:
+            decoded_object = term
     elif isinstance(term, list):
         decoded_object = [decode_object(item) for item in term]
     elif isinstance(term, dict):